@@ -1,9 +1,39 @@
 from __future__ import annotations
 
+from types import MappingProxyType
+
 from manim import *
 
 
-class GraphStyle:
+class _LazyStyleMeta(type):
+    """Metaclass that constructs the style singletons on first access.
+
+    ``StyleClass.DEFAULT`` and friends are built lazily and cached per
+    class, so importing the package does not pay for styles that are never
+    used. The cache lives on the metaclass keyed by (class, name): storing
+    the instance on the class itself would shadow the subclasses' own
+    styles through inheritance once a parent style was materialized.
+    """
+
+    _STYLE_NAMES = ("DEFAULT", "BLUE", "PURPLE", "GREEN")
+    _cache: dict[tuple[type, str], object] = {}
+
+    def __getattr__(cls, name):
+        if name in _LazyStyleMeta._STYLE_NAMES:
+            style_class = getattr(cls, f"_{name.title()}Style", None)
+            if style_class is not None:
+                key = (cls, name)
+                style = _LazyStyleMeta._cache.get(key)
+                if style is None:
+                    style = style_class()
+                    _LazyStyleMeta._cache[key] = style
+                return style
+        raise AttributeError(
+            f"type object {cls.__name__!r} has no attribute {name!r}"
+        )
+
+
+class GraphStyle(metaclass=_LazyStyleMeta):
     class _DefaultStyle:
         def __init__(self):
             self.node_circle: dict = {"color": WHITE, "stroke_width": 6, "radius": 0.33}
@@ -56,13 +86,35 @@ class GraphStyle:
                 "radius": 0.33,
             }
 
-    DEFAULT = _DefaultStyle()
-    BLUE = _BlueStyle()
-    PURPLE = _PurpleStyle()
-    GREEN = _GreenStyle()
-
 
-class CollectionStyle:
+# Square fills shared by the colored collection styles
+_BLUE_SQUARE: dict = {
+    "color": BLUE_B,
+    "fill_color": BLUE_D,
+    "stroke_width": 6,
+    "fill_opacity": 1,
+    "width": 1,
+    "height": 1,
+}
+_PURPLE_SQUARE: dict = {
+    "color": ManimColor("#eb97fc"),
+    "fill_color": ManimColor("#8c46d6"),
+    "fill_opacity": 1,
+    "stroke_width": 6,
+    "width": 1,
+    "height": 1,
+}
+_GREEN_SQUARE: dict = {
+    "color": ManimColor("#b2ff8c"),
+    "fill_color": ManimColor("#2ea556"),
+    "fill_opacity": 1,
+    "stroke_width": 6,
+    "width": 1,
+    "height": 1,
+}
+
+
+class CollectionStyle(metaclass=_LazyStyleMeta):
     class _DefaultStyle:
         def __init__(self):
             self.square: dict = {
@@ -81,43 +133,17 @@ class CollectionStyle:
     class _BlueStyle(_DefaultStyle):
         def __init__(self):
             super().__init__()
-            self.square: dict = {
-                "color": BLUE_B,
-                "fill_color": BLUE_D,
-                "stroke_width": 6,
-                "fill_opacity": 1,
-                "width": 1,
-                "height": 1,
-            }
+            self.square: dict = dict(_BLUE_SQUARE)
 
     class _PurpleStyle(_DefaultStyle):
         def __init__(self):
             super().__init__()
-            self.square: dict = {
-                "color": ManimColor("#eb97fc"),
-                "fill_color": ManimColor("#8c46d6"),
-                "fill_opacity": 1,
-                "stroke_width": 6,
-                "width": 1,
-                "height": 1,
-            }
+            self.square: dict = dict(_PURPLE_SQUARE)
 
     class _GreenStyle(_DefaultStyle):
         def __init__(self):
             super().__init__()
-            self.square: dict = {
-                "color": ManimColor("#b2ff8c"),
-                "fill_color": ManimColor("#2ea556"),
-                "fill_opacity": 1,
-                "stroke_width": 6,
-                "width": 1,
-                "height": 1,
-            }
-
-    DEFAULT = _DefaultStyle()
-    BLUE = _BlueStyle()
-    PURPLE = _PurpleStyle()
-    GREEN = _GreenStyle()
+            self.square: dict = dict(_GREEN_SQUARE)
 
 
 class StackStyle(CollectionStyle):
@@ -126,22 +152,20 @@ class StackStyle(CollectionStyle):
             super().__init__()
             self.container: dict = {"color": RED}
 
-    class _BlueStyle(_DefaultStyle, CollectionStyle._BlueStyle):
+    class _BlueStyle(_DefaultStyle):
         def __init__(self):
             super().__init__()
+            self.square: dict = dict(_BLUE_SQUARE)
 
-    class _PurpleStyle(_DefaultStyle, CollectionStyle._PurpleStyle):
+    class _PurpleStyle(_DefaultStyle):
         def __init__(self):
             super().__init__()
+            self.square: dict = dict(_PURPLE_SQUARE)
 
-    class _GreenStyle(_DefaultStyle, CollectionStyle._GreenStyle):
+    class _GreenStyle(_DefaultStyle):
         def __init__(self):
             super().__init__()
-
-    DEFAULT = _DefaultStyle()
-    BLUE = _BlueStyle()
-    PURPLE = _PurpleStyle()
-    GREEN = _GreenStyle()
+            self.square: dict = dict(_GREEN_SQUARE)
 
 
 class ArrayStyle(CollectionStyle):
@@ -154,42 +178,44 @@ class ArrayStyle(CollectionStyle):
                 "font_size": 32,
             }
 
-    class _BlueStyle(_DefaultStyle, CollectionStyle._BlueStyle):
+    class _BlueStyle(_DefaultStyle):
         def __init__(self):
             super().__init__()
+            self.square: dict = dict(_BLUE_SQUARE)
             self.index: dict = {
                 "color": BLUE_D,
                 "font": "Cascadia Code",
                 "font_size": 32,
             }
 
-    class _PurpleStyle(_DefaultStyle, CollectionStyle._PurpleStyle):
+    class _PurpleStyle(_DefaultStyle):
         def __init__(self):
             super().__init__()
+            self.square: dict = dict(_PURPLE_SQUARE)
             self.index: dict = {
                 "color": ManimColor("#fabcff"),
                 "font": "Cascadia Code",
                 "font_size": 32,
             }
 
-    class _GreenStyle(_DefaultStyle, CollectionStyle._GreenStyle):
+    class _GreenStyle(_DefaultStyle):
         def __init__(self):
             super().__init__()
+            self.square: dict = dict(_GREEN_SQUARE)
             self.index: dict = {
                 "color": WHITE,
                 "font": "Cascadia Code",
                 "font_size": 32,
             }
 
-    DEFAULT = _DefaultStyle()
-    BLUE = _BlueStyle()
-    PURPLE = _PurpleStyle()
-    GREEN = _GreenStyle()
-
 
 class VariableStyle(CollectionStyle):
     pass
 
 
 # -----------Label configs-----------
-DEFAULT_LABEL_ARGS: dict = {"color": BLUE_A, "font": "Cascadia Code", "font_size": 38}
+# Read-only: shared between every label, so the same hash table backs each
+# ``Text(**DEFAULT_LABEL_ARGS)`` expansion
+DEFAULT_LABEL_ARGS: MappingProxyType = MappingProxyType(
+    {"color": BLUE_A, "font": "Cascadia Code", "font_size": 38}
+)
@@ -7,6 +7,7 @@ from manim.typing import Vector3D
 
 from manim_dsa.constants import *
 from manim_dsa.m_collection.m_collection import *
+from manim_dsa.m_collection.m_collection import _make_text, _style_key
 from manim_dsa.utils.utils import *
 
 
@@ -38,14 +39,23 @@ class MIndexedElement(MElement):
         self
             The instance of the :class:`MIndexedElement` with the updated index.
         """
-        self -= self.index
-        self.index = utils.set_text(self.index, str(new_index))
-        self += self.index
+        old_index = self.index
+        if isinstance(old_index, Text):
+            new_text = set_text(old_index, str(new_index))
+        else:
+            # Indexes built by add_indexes are glyph slices of one shared
+            # Text; they carry the kwargs they were shaped with so a
+            # replacement can be rebuilt in the same style
+            new_text = Text(str(new_index), **old_index._text_kwargs).move_to(
+                old_index
+            )
+        self.submobjects[self.submobjects.index(old_index)] = new_text
+        self.index = new_text
         return self
 
     def add_index(
         self,
-        index: Text,
+        index: Text | VGroup,
         direction: Vector3D = UP,
         buff: float = DEFAULT_MOBJECT_TO_MOBJECT_BUFFER,
     ) -> Self:
@@ -54,8 +64,8 @@ class MIndexedElement(MElement):
 
         Parameters
         ----------
-        index : Text
-            The text object representing the index.
+        index : Text or VGroup
+            The mobject representing the index.
         direction : Vector3D, optional
             The direction in which to position the index relative to the element. Default is UP.
         buff : float, optional
@@ -68,7 +78,7 @@ class MIndexedElement(MElement):
             The instance of the :class:`MIndexedElement` with the updated index.
         """
         self.index = index.next_to(self.square, direction, buff)
-        self += self.index
+        self.submobjects.append(self.index)
         return self
 
 
@@ -78,7 +88,7 @@ class MArray(MCollection):
     Parameters
     ----------
     arr : list, optional
-        The initial list of values to populate the array. Default is an empty list.
+        The initial list of values to populate the array. Default is None.
     direction : Vector3D, optional
         The direction in which to arrange the elements. Default is RIGHT.
     margin : float, optional
@@ -89,20 +99,22 @@ class MArray(MCollection):
 
     def __init__(
         self,
-        arr: list = [],
+        arr: list | None = None,
         direction: Vector3D = RIGHT,
         style: ArrayStyle._DefaultStyle = ArrayStyle.DEFAULT,
     ):
         self._index_enabled: bool = False
         self._index_dir = None
+        self._index_kwargs = _style_key(style.index)
 
         super().__init__(arr, direction, 0, style)
 
-        self._hidden_element = MIndexedElement(
-            self._hidden_element.square,
-            self._hidden_element.value,
-        )
-        self += self._hidden_element
+        # Swap the plain sentinel for the indexed one in place: keeping both
+        # registered would add a second invisible child to every bounding-box
+        # computation for the lifetime of the array
+        old_hidden = self._hidden_element
+        self._hidden_element = MIndexedElement(old_hidden.square, old_hidden.value)
+        self._replace_submobject(old_hidden, self._hidden_element)
 
     def append(self, value: Any) -> Self:
         """Appends a new element to the end of the array. If indexing is enabled,
@@ -120,18 +132,24 @@ class MArray(MCollection):
         """
         self._update_style()
 
-        new_elem = MIndexedElement(
-            Rectangle(**self.style.square), Text(str(value), **self.style.value)
-        )
+        new_elem = self._build_element(value)
 
         self._append_helper(new_elem)
 
         if self._index_enabled:
-            index = Text(str(len(self.elements) - 1), **self.style.index)
+            index = _make_text(str(len(self.elements) - 1), self._index_kwargs).copy()
             self.elements[-1].add_index(index, self._index_dir, self._get_index_buff())
 
         return self
 
+    @override
+    def _build_element(self, value: Any) -> MIndexedElement:
+        """Builds a styled indexed element for the given value without attaching it."""
+        return self._from_pool(value) or MIndexedElement(
+            self._square_proto.copy(),
+            _make_text(str(value), self._value_kwargs).copy(),
+        )
+
     @override_animate(append)
     def _append_animation(self, value: Any, anim_args=None) -> Animation:
         """Animates the addition of a new element to the array.
@@ -154,7 +172,10 @@ class MArray(MCollection):
     def _update_style(self) -> None:
         super()._update_style()
         if self._index_enabled:
-            self.style.index["font_size"] = self._hidden_element.index.font_size
+            font_size = self._hidden_element.index.font_size
+            if font_size != self.style.index["font_size"]:
+                self.style.index["font_size"] = font_size
+                self._index_kwargs = _style_key(self.style.index)
 
     def pop(self, index: int = -1) -> Self:
         """Removes the element at the specified index and shifts all subsequent elements accordingly.
@@ -202,7 +223,9 @@ class MArray(MCollection):
 
         anims = [
             FadeOut(popped_element),
-            ApplyMethod(elem_shift.shift, -(self._dir * popped_element.square.width)),
+            ApplyMethod(
+                elem_shift.shift, self._shift_by(-popped_element.square.width)
+            ),
         ]
 
         if self._index_enabled:
@@ -223,65 +246,50 @@ class MArray(MCollection):
             curr = self.elements[i]
             new_index = old_index.copy().move_to(curr.index)
             old_index = curr.index
-            curr -= curr.index
+            # Replace the index in place instead of removing and re-adding it
+            curr.submobjects[curr.submobjects.index(curr.index)] = new_index
             curr.index = new_index
-            curr += curr.index
         return self
 
     def _get_index_buff(self) -> float:
-        square_center = self._hidden_element.square.get_center()
-        index_center = self._hidden_element.index.get_center()
-        offset = self._hidden_element.square.width / 2
-
-        if np.array_equal(self._dir, UP) or np.array_equal(self._dir, DOWN):
-            offset += self._hidden_element.index.width / 2
-            direction_offset = [offset, 0, 0]
+        hidden = self._hidden_element
+        square_y = float(hidden.square.get_center()[1])
+        index_y = float(hidden.index.get_center()[1])
+
+        # Only the y component of the result is used, so the offset matters
+        # solely when the indexes sit above or below the elements
+        if self._index_is_horizontal:
+            offset_y = 0.0
         else:
-            offset += self._hidden_element.index.height / 2
-            direction_offset = [0, offset, 0]
+            offset_y = hidden.square.width / 2 + hidden.index.height / 2
 
-        if np.array_equal(self._index_dir, UP) or np.array_equal(
-            self._index_dir, RIGHT
-        ):
-            return (index_center - square_center - direction_offset)[1]
-        else:
-            return (square_center - index_center - direction_offset)[1]
+        return self._index_sign * (index_y - square_y) - offset_y
 
     def _visual_swap(self, i: int, j: int) -> None:
         elem_i = self.elements[i]
         elem_j = self.elements[j]
         elem_i_group = VGroup(elem_i.square, elem_i.value)
-        temp = elem_i_group.copy()
         elem_j_group = VGroup(elem_j.square, elem_j.value)
-        elem_i_group.move_to(elem_j_group, DOWN)
-        elem_j_group.move_to(temp, DOWN)
+        # Capture the target points directly: copying a group just to read
+        # its position would deep-copy the whole subtree
+        bottom_i = elem_i_group.get_critical_point(DOWN)
+        bottom_j = elem_j_group.get_critical_point(DOWN)
+        elem_i_group.move_to(bottom_j, DOWN)
+        elem_j_group.move_to(bottom_i, DOWN)
 
     def _logic_swap(self, i: int, j: int) -> None:
-        # Element swap
-        # We have to remove first them from the scene to work correctly
-        self -= self.elements[i]
-        self -= self.elements[j]
-
-        self.elements[i], self.elements[j] = self.elements[j], self.elements[i]
+        super()._logic_swap(i, j)
 
         if self._index_enabled:
-            # Index swap
-            # We have to remove first them from the scene to work correctly
-            self.elements[i] -= self.elements[i].index
-            self.elements[j] -= self.elements[j].index
-
-            self.elements[i].index, self.elements[j].index = (
-                self.elements[j].index,
-                self.elements[i].index,
-            )
+            # Index swap, done in place on each element's submobjects list
+            elem_i, elem_j = self.elements[i], self.elements[j]
+            pos_i = elem_i.submobjects.index(elem_i.index)
+            pos_j = elem_j.submobjects.index(elem_j.index)
 
-            # We can add the indexes again
-            self.elements[i] += self.elements[i].index
-            self.elements[j] += self.elements[j].index
+            elem_i.index, elem_j.index = elem_j.index, elem_i.index
 
-        # We can add the elements again
-        self += self.elements[i]
-        self += self.elements[j]
+            elem_i.submobjects[pos_i] = elem_i.index
+            elem_j.submobjects[pos_j] = elem_j.index
 
     def add_indexes(
         self,
@@ -315,20 +323,36 @@ class MArray(MCollection):
         """
         if self._index_enabled:
             return self
-        if np.array_equal(np.abs(self._dir), np.abs(direction)):
+        if np.array_equal(direction, self._dir) or np.array_equal(
+            direction, -self._dir
+        ):
             raise Exception(
                 "The direction given is parallel to array growth direction!"
             )
 
         self._index_enabled = True
         self._index_dir = direction
+        # The index direction is orthogonal to the growth direction, so
+        # these two flags capture everything _get_index_buff needs per append
+        self._index_is_horizontal = abs(direction[0]) > 0.5
+        self._index_sign = 1.0 if direction[0] + direction[1] > 0 else -1.0
 
         self._hidden_element.add_index(
             Text("0", **self.style.index, fill_opacity=0), direction, buff
         )
-        for i in range(len(self.elements)):
-            self.elements[i].add_index(
-                Text(str(i), **self.style.index), direction, buff
-            )
+
+        if self.elements:
+            # A single Text amortizes font setup and shaping over every
+            # index: its glyphs are sliced into one group per element.
+            labels = [str(i) for i in range(len(self.elements))]
+            glyphs = Text("".join(labels), **self.style.index).submobjects
+            pos = 0
+            for element, label in zip(self.elements, labels, strict=True):
+                group = VGroup(*glyphs[pos : pos + len(label)])
+                # set_index needs the Text styling a glyph slice does not
+                # carry itself
+                group._text_kwargs = dict(self.style.index)
+                element.add_index(group, direction, buff)
+                pos += len(label)
 
         return self
@@ -1,15 +1,41 @@
 from __future__ import annotations
 
 from abc import ABC
+from functools import lru_cache
 from typing import Any, Self, override
 
 from manim import *
-from manim.typing import Vector3D
+from manim.typing import Point3D, Vector3D
 
 from manim_dsa.constants import *
 from manim_dsa.utils.utils import *
 
 
+@lru_cache(maxsize=4096)
+def _make_text(value_str: str, kwargs_tuple: tuple) -> Text:
+    """Builds and caches a Text prototype for the given string and style kwargs.
+
+    Font loading and text shaping dominate element construction time, so the
+    rendered Text is cached here and callers must work on a ``.copy()`` of it.
+    """
+    return Text(value_str, **dict(kwargs_tuple))
+
+
+def _style_key(style_dict: dict) -> tuple:
+    """Builds a hashable ``_make_text`` key from a Text style dict.
+
+    ManimColor defines equality without a hash, so colors are keyed by
+    their hex form; Text parses the hex string back into a color on the
+    cache miss.
+    """
+    return tuple(
+        sorted(
+            (key, value.to_hex() if isinstance(value, ManimColor) else value)
+            for key, value in style_dict.items()
+        )
+    )
+
+
 class MElement(VGroup, Highlightable):
     """Represents an element in a visual collection, consisting of a square and a value.
 
@@ -26,8 +52,10 @@ class MElement(VGroup, Highlightable):
         self.square = square
         self.value = value.move_to(self.square)
         self._add_highlight(self.square)
-        self += self.square
-        self += self.value
+        # Fresh by construction: appending directly skips add()'s
+        # duplicate scan over the submobjects list
+        self.submobjects.append(self.square)
+        self.submobjects.append(self.value)
 
     def set_value(self, new_value: Any) -> Self:
         """Updates the value of the element.
@@ -46,9 +74,9 @@ class MElement(VGroup, Highlightable):
         self
             The updated instance of :class:`MElement` with the new value.
         """
-        self -= self.value
-        self.value = set_text(self.value, str(new_value))
-        self += self.value
+        new_text = set_text(self.value, str(new_value))
+        self.submobjects[self.submobjects.index(self.value)] = new_text
+        self.value = new_text
         return self
 
     @override_animate(set_value)
@@ -77,7 +105,7 @@ class MCollection(ABC, VGroup, Labelable):
     Parameters
     ----------
     arr : list, optional
-        The initial list of values to populate the collection. Default is an empty list.
+        The initial list of values to populate the collection. Default is None.
     direction : Vector3D, optional
         The direction in which to arrange the elements. Default is RIGHT.
     margin : float, optional
@@ -88,7 +116,7 @@ class MCollection(ABC, VGroup, Labelable):
 
     def __init__(
         self,
-        arr: list = [],
+        arr: list | None = None,
         direction: Vector3D = RIGHT,
         margin: float = 0,
         style: CollectionStyle._DefaultStyle = CollectionStyle.DEFAULT,
@@ -97,32 +125,37 @@ class MCollection(ABC, VGroup, Labelable):
         self.elements = []
         self.style = style
         self.margin = margin
+        self._elem_pool: list[MElement] = []
+
+        self._square_proto = Rectangle(**style.square)
+        self._value_kwargs = _style_key(style.value)
 
         self._hidden_element = MElement(
-            Rectangle(**style.square).set_opacity(0),
-            Text("0", **style.value).set_opacity(0),
+            self._square_proto.copy().set_opacity(0),
+            _make_text("0", self._value_kwargs).copy().set_opacity(0),
         )
-        self += self._hidden_element
-
-        self._dir = direction
-        self._dir_map = {
-            UP.data.tobytes(): RIGHT,
-            DOWN.data.tobytes(): RIGHT,
-            RIGHT.data.tobytes(): UP,
-            LEFT.data.tobytes(): UP,
-        }
-
-        for v in arr:
-            self.append(v)
+        self.submobjects.append(self._hidden_element)
+
+        self._dir = np.ascontiguousarray(direction, dtype=np.float64)
+        # Plain-float copy of the direction: shifting by a tuple avoids an
+        # ndarray allocation per pop/append
+        self._dir_f = (float(self._dir[0]), float(self._dir[1]), float(self._dir[2]))
+
+        if arr:
+            self._append_batch(arr)
         self.move_to(ORIGIN)
 
-    def append(self, value: Any) -> Self:
+    def append(self, value: Any, initial_position: Point3D | None = None) -> Self:
         """Appends a new element to the collection, styled according to the current configuration.
 
         Parameters
         ----------
         value : Any
             The value to append. It will be converted to a string representation.
+        initial_position : Point3D, optional
+            Where to place the new element instead of its slot in the
+            collection; used by animations that move the element into place
+            themselves. Default is None.
 
         Returns
         -------
@@ -131,28 +164,104 @@ class MCollection(ABC, VGroup, Labelable):
         """
         self._update_style()
 
-        new_elem = MElement(
-            Rectangle(**self.style.square), Text(str(value), **self.style.value)
-        )
+        new_elem = self._build_element(value)
 
-        self._append_helper(new_elem)
+        self._append_helper(new_elem, initial_position)
         return self
 
-    def _append_helper(self, new_element: MElement) -> None:
+    def _build_element(self, value: Any) -> MElement:
+        """Builds a styled element for the given value without attaching it."""
+        return self._from_pool(value) or MElement(
+            self._square_proto.copy(),
+            _make_text(str(value), self._value_kwargs).copy(),
+        )
+
+    def _from_pool(self, value: Any) -> MElement | None:
+        """Revives a previously popped element instead of building a new one.
+
+        An element is only reused when it is pristine (just its square and
+        value, so no index or highlight is attached) and still matches the
+        current element size; anything else is discarded.
+        """
+        while self._elem_pool:
+            elem = self._elem_pool.pop()
+            if (
+                len(elem.submobjects) == 2
+                and elem.square.width == self.style.square["width"]
+            ):
+                return elem.set_value(value)
+        return None
+
+    def _append_batch(self, arr: list) -> None:
+        """Builds, positions and attaches one element per value in a single pass.
+
+        Appending in a loop would reposition through ``next_to`` and rescan
+        the submobjects list for every element; here the centers are derived
+        arithmetically and the elements are attached in one bulk extend.
+        """
+        elements = [self._build_element(v) for v in arr]
+
+        axis = 0 if abs(self._dir[0]) > 0.5 else 1
+        half_side = self._hidden_element.square.width / 2
+        center = self._hidden_element.square.get_center()
+
+        elements[0].move_to(center)
+        for elem in elements[1:]:
+            center = center + self._dir * (
+                half_side + self.margin + elem.length_over_dim(axis) / 2
+            )
+            elem.move_to(center)
+
+        self.elements = elements
+        self.submobjects.extend(elements)
+
+    def _append_helper(
+        self, new_element: MElement, initial_position: Point3D | None = None
+    ) -> None:
         self.elements.append(new_element)
 
-        if len(self.elements) > 1:
-            self.elements[-1].next_to(self.elements[-2].square, self._dir, self.margin)
+        if initial_position is not None:
+            new_element.move_to(initial_position)
+        elif len(self.elements) > 1:
+            new_element.next_to(self.elements[-2].square, self._dir, self.margin)
         else:
-            self.elements[-1].move_to(self._hidden_element.square)
+            new_element.move_to(self._hidden_element.square)
 
-        self += self.elements[-1]
+        self.submobjects.append(new_element)
 
-    def _update_style(self) -> None:
-        self.style.square["width"] = self.style.square["height"] = (
-            self._hidden_element.square.width
+    def _next_center(self, new_element: MElement, prev: MElement | None) -> Point3D:
+        """Computes the center an element appended after ``prev`` will occupy.
+
+        Mirrors the arithmetic of ``_append_batch`` so callers can derive the
+        slot position without an extra ``next_to`` bounding-box pass.
+        """
+        if prev is None:
+            return self._hidden_element.square.get_center()
+        axis = 0 if abs(self._dir[0]) > 0.5 else 1
+        return prev.square.get_center() + self._dir * (
+            prev.square.width / 2
+            + self.margin
+            + new_element.length_over_dim(axis) / 2
         )
-        self.style.value["font_size"] = self._hidden_element.value.font_size
+
+    def _update_style(self) -> None:
+        square_side = self._hidden_element.square.width
+        font_size = self._hidden_element.value.font_size
+        if (
+            square_side == self.style.square["width"]
+            and font_size == self.style.value["font_size"]
+        ):
+            # Common case: nothing was scaled since the last append, so the
+            # style dicts and cached prototypes are already up to date
+            return
+
+        self.style.square["width"] = self.style.square["height"] = square_side
+        if square_side != self._square_proto.width:
+            self._square_proto = Rectangle(**self.style.square)
+
+        if font_size != self.style.value["font_size"]:
+            self.style.value["font_size"] = font_size
+            self._value_kwargs = _style_key(self.style.value)
 
     @override_animate(append)
     def _append_animation(self, value: Any, anim_args=None) -> Animation:
@@ -196,10 +305,37 @@ class MCollection(ABC, VGroup, Labelable):
             popped_element = self._logic_pop(index)
 
             VGroup(*self.elements[index:]).shift(
-                -(self._dir * popped_element.square.width)
+                self._shift_by(-popped_element.square.width)
             )
+            # A plain pop leaves the element untouched, so it can be
+            # revived by a later append; animated pops fade it out instead
+            self._elem_pool.append(popped_element)
+        return self
+
+    def pop_back(self) -> Self:
+        """Removes the last element of the collection.
+
+        The last element has no successors, so unlike :meth:`pop` there is
+        no index translation and no shift pass over the remaining elements.
+
+        Returns
+        -------
+        self
+            The instance of the :class:`MCollection` with the last element removed.
+        """
+        if self.elements:
+            popped_element = self.elements.pop()
+            self -= popped_element
+            self._elem_pool.append(popped_element)
         return self
 
+    def _shift_by(self, distance: float) -> tuple[float, float, float]:
+        return (
+            self._dir_f[0] * distance,
+            self._dir_f[1] * distance,
+            self._dir_f[2] * distance,
+        )
+
     @override_animate(pop)
     def _pop_animation(self, index: int = -1, anim_args=None) -> Animation:
         """Animates the removal of an element from the collection.
@@ -222,7 +358,9 @@ class MCollection(ABC, VGroup, Labelable):
 
         anims = [
             FadeOut(popped_element),
-            ApplyMethod(elem_shift.shift, -(self._dir * popped_element.square.width)),
+            ApplyMethod(
+                elem_shift.shift, self._shift_by(-popped_element.square.width)
+            ),
         ]
 
         return Succession(*anims, **anim_args, group=VGroup(self, popped_element))
@@ -230,21 +368,26 @@ class MCollection(ABC, VGroup, Labelable):
     def _visual_swap(self, i: int, j: int):
         elem_i = self.elements[i]
         elem_j = self.elements[j]
-        temp = elem_i.copy()
-        elem_i.move_to(elem_j, DOWN)
-        elem_j.move_to(temp, DOWN)
+        # Capture the target points directly: copying an element just to
+        # read its position would deep-copy the whole subtree
+        bottom_i = elem_i.get_critical_point(DOWN)
+        bottom_j = elem_j.get_critical_point(DOWN)
+        elem_i.move_to(bottom_j, DOWN)
+        elem_j.move_to(bottom_i, DOWN)
+
+    def _replace_submobject(self, old: VMobject, new: VMobject) -> None:
+        # Swapping in place avoids the linear scans a remove/re-add pair
+        # would run over the submobjects list
+        self.submobjects[self.submobjects.index(old)] = new
 
     def _logic_swap(self, i: int, j: int):
-        # Element swap
-        # We have to remove first them from the scene to work correctly
-        self -= self.elements[i]
-        self -= self.elements[j]
-
-        self.elements[i], self.elements[j] = self.elements[j], self.elements[i]
+        elem_i, elem_j = self.elements[i], self.elements[j]
+        self.elements[i], self.elements[j] = elem_j, elem_i
 
-        # We can add the elements again
-        self += self.elements[i]
-        self += self.elements[j]
+        # Element swap, done in place on the submobjects list
+        submobjects = self.submobjects
+        pos_i, pos_j = submobjects.index(elem_i), submobjects.index(elem_j)
+        submobjects[pos_i], submobjects[pos_j] = elem_j, elem_i
 
     def swap(self, i: int, j: int) -> Self:
         """Swaps the positions of two elements in the collection.
@@ -337,10 +480,11 @@ class MCollection(ABC, VGroup, Labelable):
         super().add_label(text, direction, buff, **kwargs)
 
         # If label position is parallel to array growth direction,
-        # the label have to be centered
-        if np.array_equal(self._dir, direction):
+        # the label have to be centered; exact comparisons so diagonals
+        # like UR on a RIGHT-growing collection stay centered
+        if np.array_equal(direction, self._dir):
             reference_element = self._get_square_else_spawnpoint(-1)
-        elif np.array_equal(self._dir, -direction):
+        elif np.array_equal(direction, -self._dir):
             reference_element = self._get_square_else_spawnpoint(0)
         else:
             reference_element = None
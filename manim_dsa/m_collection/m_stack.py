@@ -16,7 +16,7 @@ class MStack(MCollection):
     Parameters
     ----------
     arr : list, optional
-        The initial list of values to populate the stack. Default is an empty list.
+        The initial list of values to populate the stack. Default is None.
     buff : float, optional
         The buffer (margin) between elements in the stack. Default is 0.1.
     style : StackStyle._DefaultStyle, optional
@@ -25,41 +25,63 @@ class MStack(MCollection):
 
     def __init__(
         self,
-        arr: list = [],
+        arr: list | None = None,
         buff: float = 0.1,
         style: StackStyle._DefaultStyle = StackStyle.DEFAULT,
     ):
         super().__init__(arr, UP, buff, style)
 
-        elem = self.elements[0].square if self.elements else self._hidden_element.square
-        container_height = (
-            (len(arr) + 3) * elem.height
-            if arr
-            else self._hidden_element.square.height * 7
+        square = (
+            self.elements[0].square if self.elements else self._hidden_element.square
         )
-
-        self.bottom_line: Line = Line(ORIGIN, [elem.width + 2 * buff, 0, 0]).next_to(
-            elem, DOWN, buff
-        )
-        self.left_line: Line = Line([0, container_height, 0], ORIGIN).next_to(
+        # The squares were just built from the style, so their dimensions can
+        # be read straight from it instead of through a bounding-box pass
+        height = style.square["height"]
+        width = style.square["width"]
+        container_height = (len(arr) + 3) * height if arr else height * 7
+
+        # ndarray endpoints skip the list-to-array conversion in Line.__init__
+        p_bottom = np.array([width + 2 * buff, 0.0, 0.0])
+        p_wall_top = np.array([0.0, container_height, 0.0])
+        self.bottom_line: Line = Line(ORIGIN, p_bottom).next_to(square, DOWN, buff)
+        self.left_line: Line = Line(p_wall_top, ORIGIN).next_to(
             self.bottom_line, UL, 0
         )
-        self.right_line: Line = self.left_line.copy().next_to(self.bottom_line, UR, 0)
+        self.right_line: Line = Line(p_wall_top, ORIGIN).next_to(
+            self.bottom_line, UR, 0
+        )
 
+        # Grouping reference only: the lines are added as direct children so
+        # family traversals see them without an extra VGroup level
         self.container: VGroup = VGroup(
             self.left_line, self.bottom_line, self.right_line
         )
-        self += self.container
+        self.add(self.left_line, self.bottom_line, self.right_line)
         self.move_to(ORIGIN)
-        self.spawnpoint: Point3D = None
-
-        # When the stack is scaled or moved,
-        # the spawn_point of the objects must be changed as well
-        def update_stack_attr(obj):
-            obj.spawnpoint = obj.get_spawn_point()
-            obj.margin = buff * self._hidden_element.square.width
-
-        self.add_updater(update_stack_attr)
+        self._buff = buff
+        self._square_w_up = UP * self._hidden_element.square.width
+        self.spawnpoint: Point3D = self.get_spawn_point()
+        self.margin = buff * self._hidden_element.square.width
+        self._last_center = self.get_center()
+        self._last_width = self._hidden_element.square.width
+
+    def _ensure_spawn(self) -> None:
+        """Refreshes the cached spawn point and margin if the stack moved.
+
+        Animations rewrite points without going through shift or scale, so
+        the check compares observed geometry against the cached values; the
+        methods that read the cache call this first instead of paying for a
+        per-frame updater.
+        """
+        center = self.get_center()
+        width = self._hidden_element.square.width
+        if width == self._last_width and (center == self._last_center).all():
+            return
+        self._last_center = center
+        self._last_width = width
+        self._square_w_up = UP * width
+        self.spawnpoint = self.get_spawn_point()
+        self.margin = self._buff * width
 
     def get_spawn_point(self) -> Point3D:
         """Calculates the drop point for new elements in the stack.
@@ -72,23 +94,27 @@ class MStack(MCollection):
         return (
             self.bottom_line.get_center()
             + (UP * self.right_line.height)
-            + UP * self._hidden_element.square.width
+            + self._square_w_up
         )
 
-    def append(self, value: Any) -> Self:
+    def append(self, value: Any, initial_position: Point3D | None = None) -> Self:
         """Appends a new value to the top of the stack.
 
         Parameters
         ----------
         value : Any
             The value to be added to the stack. It will be converted to a string representation.
+        initial_position : Point3D, optional
+            Where to place the new element instead of the top of the stack;
+            used by the append animation. Default is None.
 
         Returns
         -------
         self
             The instance of the :class:`MStack` with the newly appended element.
         """
-        return super().append(value)
+        self._ensure_spawn()
+        return super().append(value, initial_position)
 
     @override_animate(append)
     def _append_animation(self, value: Any, anim_args=None) -> Succession:
@@ -106,13 +132,17 @@ class MStack(MCollection):
         Succession
             The animation object representing the append operation.
         """
-        self.append(value)
-        new_pos = self.elements[-1].get_center()
-        self.elements[-1].move_to(self.spawnpoint)
+        # Spawn the element at the drop point and derive its slot position
+        # arithmetically instead of placing it twice
+        self._ensure_spawn()
+        self.append(value, initial_position=self.spawnpoint)
+        top = self.elements[-1]
+        prev = self.elements[-2] if len(self.elements) > 1 else None
+        new_pos = self._next_center(top, prev)
 
         return Succession(
-            Create(self.elements[-1]),
-            ApplyMethod(self.elements[-1].move_to, new_pos),
+            Create(top),
+            ApplyMethod(top.move_to, new_pos),
             **anim_args,
             group=self,
         )
@@ -126,7 +156,7 @@ class MStack(MCollection):
         self
             The instance of the :class:`MStack` with the top element removed.
         """
-        return super().pop(len(self.elements) - 1)
+        return super().pop_back()
 
     @override_animate(pop)
     def _pop_animation(self, anim_args=None) -> Succession:
@@ -142,8 +172,10 @@ class MStack(MCollection):
         Succession
             The animation object representing the pop operation.
         """
-        popped_element = self.elements[-1].copy()
-        self.pop()
+        # The element is leaving the stack anyway, so detach and animate it
+        # directly rather than deep-copying it first
+        self._ensure_spawn()
+        popped_element = self._logic_pop(len(self.elements) - 1)
         return Succession(
             ApplyMethod(popped_element.move_to, self.spawnpoint),
             FadeOut(popped_element),
@@ -178,5 +210,6 @@ class MStack(MCollection):
             The instance of the :class:`MStack` with the label added.
         """
         super().add_label(text, direction, buff, **kwargs)
-        self.label.move_to(self.get_spawn_point())
+        self._ensure_spawn()
+        self.label.move_to(self.spawnpoint)
         return self
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from math import *
+from sys import intern
 from typing import Self, override
 
 import networkx as nx
@@ -10,6 +11,7 @@ from manim.typing import Point3D, Vector3D
 
 from manim_dsa.constants import *
 from manim_dsa.m_collection.m_collection import *
+from manim_dsa.m_collection.m_collection import _make_text, _style_key
 from manim_dsa.utils.utils import *
 
 type GraphType = (
@@ -23,6 +25,12 @@ type GraphType = (
     | dict[str, list[tuple[str, str | int]]]
 )
 
+# node_layout results shared across MGraph instances: scenes often rebuild
+# the same graph between previews, and the topology is part of the key so
+# stale entries can never be served
+_LAYOUT_CACHE: dict[tuple, dict] = {}
+_LAYOUT_CACHE_MAX = 32
+
 
 class MGraph(VDict, Labelable):
     """Manim Graph: a class for visualizing the graph structure using the Manim animation engine.
@@ -38,6 +46,18 @@ class MGraph(VDict, Labelable):
         The visual style to be applied to the graph. Defaults to GraphStyle.DEFAULT.
     """
 
+    # The layouts scenes actually use, resolved once at import time; other
+    # NetworkX layouts still work through the getattr fallback in
+    # node_layout
+    _LAYOUTS = {
+        "kamada_kawai_layout": nx.kamada_kawai_layout,
+        "spring_layout": nx.spring_layout,
+        "circular_layout": nx.circular_layout,
+        "shell_layout": nx.shell_layout,
+        "spectral_layout": nx.spectral_layout,
+        "planar_layout": nx.planar_layout,
+    }
+
     def __init__(
         self,
         graph: GraphType,
@@ -48,32 +68,59 @@ class MGraph(VDict, Labelable):
 
         self.nodes: dict[str, MGraph.Node] = {}
         self.edges: dict[tuple[str, str], MGraph.Edge] = {}
+        # Center and radius per node, so edge construction does not have to
+        # run a bounding-box query on the circle for every endpoint
+        self._node_geom: dict[str, tuple[Point3D, float]] = {}
         self.style = style
+        # Weight labels repeat across edges, so their Text prototypes are
+        # shared through the memoized _make_text helper
+        self._edge_weight_kwargs = _style_key(style.edge_weight)
+        self._user_positions = dict(nodes_position) if nodes_position else None
 
         for node in graph:
             pos: Vector3D = nodes_position.get(node, ORIGIN)
-            self.add_node(node, pos)
+            self._make_node(node, pos)
 
         if isinstance(graph, (list, dict)):
-            # The graph can be list of list or dict of list
+            # The adjacency structure is homogeneous (see GraphType), so one
+            # look at the first entry decides the dispatch for all edges:
+            # {'0': ['1', '2']} is unweighted, {'0': [('1', 2)]} is weighted
+            weighted = False
+            for destinations in graph.values() if isinstance(graph, dict) else graph:
+                if destinations:
+                    weighted = isinstance(destinations[0], tuple)
+                    break
+
+            # Harvest the edges first: when both directions of a pair are
+            # present, each half can be built arrowless right away instead of
+            # arrowed, torn down and rebuilt once the opposite one shows up
+            edge_specs: list[tuple[str, str, float | None]] = []
             for src, destinations in (
                 graph.items() if isinstance(graph, dict) else enumerate(graph)
             ):
-                for dest in destinations:
-                    # If the graph is not weighted
-                    # Example: {'0': ['1', '2']}
-                    if isinstance(dest, str):
-                        self.add_edge(str(src), dest)
-                    # If the graph is weighted
-                    # Example: {'0': [('1', 2), ('2', 4)]}
-                    elif (
-                        isinstance(dest, tuple)
-                        and len(dest) == 2
-                        and isinstance(dest[0], str)
-                        and isinstance(dest[1], int)
-                    ):
-                        dest, weight = dest
-                        self.add_edge(str(src), dest, weight)
+                if weighted:
+                    for dest, weight in destinations:
+                        edge_specs.append((str(src), dest, weight))
+                else:
+                    for dest in destinations:
+                        edge_specs.append((str(src), dest, None))
+
+            directed = {(src, dest) for src, dest, _ in edge_specs}
+            built: set[tuple[str, str]] = set()
+            for src, dest, weight in edge_specs:
+                symmetric = src != dest and (dest, src) in directed
+                if symmetric and (dest, src) not in built:
+                    # Mirror add_edge's reverse rebuild: only the later half
+                    # of a symmetric pair carries the weight label
+                    weight = None
+                self._make_edge(
+                    src, dest, weight, arrow=False if symmetric else None
+                )
+                built.add((src, dest))
+
+        # Register everything in one pass: per-item adds would rerun the
+        # VDict family update for every node and edge
+        self.add(list(self.nodes.items()) + list(self.edges.items()))
 
     class Node(VGroup, Highlightable):
         """A class that represents a node (or vertex) of the graph.
@@ -124,6 +171,9 @@ class MGraph(VDict, Labelable):
             super().__init__()
             self.line: Line | ArcBetweenPoints = line.set_z_index(0)
             self.label: Text = None
+            # Endpoints last applied by node_layout, letting repeat
+            # layouts skip edges that did not move
+            self._last_endpoints: tuple[Point3D, Point3D] | None = None
 
             if arrow:
                 self.line.add_tip()
@@ -372,16 +422,44 @@ class MGraph(VDict, Labelable):
             tuple[Point3D, Point3D]
                 A tuple containing two Point3D objects representing the start and end points of the line.
             """
-            direction = Line(node1_center, node2_center).get_unit_vector()
+            # Plain vector arithmetic: building a Line just for its unit
+            # vector would allocate a whole mobject per edge
+            d = np.subtract(node2_center, node1_center)
+            norm = hypot(d[0], d[1], d[2])
+
+            # The endpoints coincide when the centers overlap or the circles
+            # touch exactly; fall back to a unit segment in both cases
+            if norm == 0.0 or norm == node1_radius + node2_radius:
+                return LEFT, RIGHT
+
+            direction = d / norm
             start = node1_center + direction * node1_radius
             end = node2_center - direction * node2_radius
 
-            if np.array_equal(start, end):
-                start = LEFT
-                end = RIGHT
-
             return start, end
 
+        @staticmethod
+        def _batch_start_end(
+            c1s: np.ndarray, c2s: np.ndarray, r1s: np.ndarray, r2s: np.ndarray
+        ) -> tuple[np.ndarray, np.ndarray]:
+            """Vectorized counterpart of :meth:`_get_line_start_end`.
+
+            Takes (E, 3) center arrays and (E,) radius arrays and returns
+            the trimmed start and end points for all E edges in one
+            broadcast pass; node_layout uses it so the Python-level work
+            per edge shrinks to the put_start_and_end_on call.
+            """
+            d = c2s - c1s
+            norm = np.linalg.norm(d, axis=1)
+            degenerate = (norm == 0.0) | (norm == r1s + r2s)
+            norm[degenerate] = 1.0
+            direction = d / norm[:, None]
+            starts = c1s + direction * r1s[:, None]
+            ends = c2s - direction * r2s[:, None]
+            starts[degenerate] = LEFT
+            ends[degenerate] = RIGHT
+            return starts, ends
+
         def _get_label_position(self, label_distance: float) -> Point3D:
             """Calculates the position of the label (the weight) relative to the edge.
 
@@ -395,11 +473,12 @@ class MGraph(VDict, Labelable):
             Point3D
                 The 3D coordinates where the label should be positioned.
             """
-            direction: Point3D = self.line.get_unit_vector()
-            mean: Point3D = (
-                self.line.get_start() + direction * self.line.get_length() / 2
-            )
-            orthogonal_dir: Point3D = np.array([direction[1], -direction[0], 0])
+            start: Point3D = self.line.get_start()
+            end: Point3D = self.line.get_end()
+            d = end - start
+            norm = sqrt(d[0] * d[0] + d[1] * d[1] + d[2] * d[2]) or 1.0
+            mean: Point3D = (start + end) / 2
+            orthogonal_dir: Point3D = np.array([d[1] / norm, -d[0] / norm, 0])
             position: Point3D = mean + orthogonal_dir * label_distance
             return position
 
@@ -506,28 +585,31 @@ class MGraph(VDict, Labelable):
                 A tuple containing two `Point3D` objects representing the start and end points of the edge.
             """
 
-            edge_direction = Line(node1_center, node2_center).get_unit_vector()
-            edge_angle = acos(edge_direction[0])
-            if edge_direction[1] < 0:
-                edge_angle = -edge_angle
+            # Local bindings skip the module-global lookup per trig call
+            cos_f, sin_f = cos, sin
 
-            vector_start = [
-                cos(edge_angle - start_angle),
-                sin(edge_angle - start_angle),
-                0,
-            ]
+            d = np.subtract(node2_center, node1_center)
+            edge_angle = atan2(d[1], d[0])
 
-            vector_end = [
-                cos(edge_angle - (PI - start_angle)),
-                sin(edge_angle - (PI - start_angle)),
-                0,
-            ]
+            start_angle_abs = edge_angle - start_angle
+            end_angle_abs = edge_angle - (PI - start_angle)
 
-            direction_start = normalize(vector_start)
-            direction_end = normalize(vector_end)
-
-            start = node1_center + direction_start * node1_radius
-            end = node2_center + direction_end * node2_radius
+            # sin and cos of an angle already form a unit vector, so no
+            # normalize pass is needed
+            start = node1_center + np.array(
+                [
+                    cos_f(start_angle_abs) * node1_radius,
+                    sin_f(start_angle_abs) * node1_radius,
+                    0.0,
+                ]
+            )
+            end = node2_center + np.array(
+                [
+                    cos_f(end_angle_abs) * node2_radius,
+                    sin_f(end_angle_abs) * node2_radius,
+                    0.0,
+                ]
+            )
 
             return start, end
 
@@ -546,17 +628,17 @@ class MGraph(VDict, Labelable):
             Point3D
                 The 3D coordinates where the label should be positioned relative to the edge.
             """
-            arc = ArcBetweenPoints(
-                self.line.get_start(),
-                self.line.get_end(),
-                self.arc_angle,
-            )
-            line = Line(self.line.get_start(), self.line.get_end())
-            direction = line.get_unit_vector()
-            orthogonal_dir = np.array([direction[1], -direction[0], 0])
-            position = (
-                arc.get_boundary_point(orthogonal_dir)
-                + orthogonal_dir * len(line) * label_distance
+            start = self.line.get_start()
+            end = self.line.get_end()
+            d = end - start
+            norm = sqrt(d[0] * d[0] + d[1] * d[1] + d[2] * d[2]) or 1.0
+            orthogonal_dir = np.array([d[1] / norm, -d[0] / norm, 0])
+            # Closed form instead of sampling the arc for a boundary point:
+            # the midpoint of a circular arc sits (chord/2)*tan(angle/4) off
+            # the chord midpoint, on the side a positive angle bulges toward
+            sagitta = norm / 2 * tan(self.arc_angle / 4)
+            position = (start + end) / 2 + orthogonal_dir * (
+                sagitta + label_distance
             )
             return position
 
@@ -575,13 +657,22 @@ class MGraph(VDict, Labelable):
         self
             The updated instance of the :class:`MGraph' with the new node added.
         """
+        self.add([(name, self._make_node(name, position))])
+        return self
+
+    def _make_node(self, name: str, position: Point3D = ORIGIN) -> Node:
+        """Builds a node and records it without registering it in the VDict."""
+        # Interned names give identity-based hashing in every later node,
+        # geometry and edge-key lookup
+        name = intern(str(name))
+        circle = Circle(**self.style.node_circle).move_to(position)
         new_node: self.Node = self.Node(
-            Circle(**self.style.node_circle).move_to(position),
+            circle,
             Text(str(name), **self.style.node_label).move_to(position),
         )
         self.nodes[name] = new_node
-        self.add([(name, new_node)])
-        return self
+        self._node_geom[name] = (np.asarray(position, dtype=float), circle.radius)
+        return new_node
 
     @override_animate(add_node)
     def _add_node_animation(
@@ -634,49 +725,82 @@ class MGraph(VDict, Labelable):
         self
             The updated instance of the :class:'MGraph' with the new edge added.
         """
+        # The cached geometry is only refreshed by the constructor and
+        # node_layout; the graph may have been moved since, so read the
+        # circles live before building the edge
+        for name in (node1_name, node2_name):
+            circle = self.nodes[name].circle
+            self._node_geom[name] = (circle.get_center(), circle.radius)
+
+        pairs = self._make_edge(node1_name, node2_name, weight, label_distance)
+        for key, _ in pairs:
+            if key in self.submob_dict:
+                self.remove(key)
+        self.add(pairs)
+        return self
+
+    def _make_edge(
+        self,
+        node1_name: str,
+        node2_name: str,
+        weight: float = None,
+        label_distance: float = 0.2,
+        arrow: bool | None = None,
+    ) -> list[tuple[tuple[str, str], Edge]]:
+        """Builds an edge and records it without registering it in the VDict.
+
+        Returns the (key, edge) pairs the caller has to register; when a
+        reverse edge already exists it is rebuilt without its arrow and
+        returned as an extra pair. Passing ``arrow`` explicitly skips that
+        reverse handling; the constructor uses it for edges it already knows
+        to be one half of an undirected pair.
+        """
+        node1_name = intern(node1_name)
+        node2_name = intern(node2_name)
         edge_name = (node1_name, node2_name)
         edge_name_rev = (node2_name, node1_name)
 
-        node1 = self.nodes[node1_name].circle
-        node2 = self.nodes[node2_name].circle
+        center1, radius1 = self._node_geom[node1_name]
+        center2, radius2 = self._node_geom[node2_name]
 
-        reverse_exists = edge_name_rev in self.edges
+        reverse_exists = arrow is None and edge_name_rev in self.edges
+        if arrow is None:
+            arrow = not reverse_exists
 
         line = Line(**self.style.edge_line)
 
         new_edge = self.StraightEdge(
             line,
-            node1.get_center(),
-            node2.get_center(),
-            node1.get_radius(),
-            node2.get_radius(),
-            not reverse_exists,
+            center1,
+            center2,
+            radius1,
+            radius2,
+            arrow,
         )
         if weight:
             new_edge.weighted(
-                Text(str(weight), **self.style.edge_weight),
+                _make_text(str(weight), self._edge_weight_kwargs).copy(),
                 label_distance,
             )
 
-        if edge_name_rev in self.edges:
+        pairs = []
+        if reverse_exists:
+            # The rebuilt reverse edge needs its own Line: sharing the one
+            # above would let put_start_and_end_on clobber the new edge
             new_edge_rev_node = self.StraightEdge(
-                line,
-                node2.get_center(),
-                node1.get_center(),
-                node2.get_radius(),
-                node1.get_radius(),
+                Line(**self.style.edge_line),
+                center2,
+                center1,
+                radius2,
+                radius1,
                 False,
             )
-            if weight:
-                new_edge.weighted(new_edge.label, label_distance)
-
-            self.remove(edge_name_rev)
             self.edges[edge_name_rev] = new_edge_rev_node
-            self.add([(edge_name_rev, new_edge_rev_node)])
+            pairs.append((edge_name_rev, new_edge_rev_node))
 
         self.edges[edge_name] = new_edge
-        self.add([(edge_name, new_edge)])
-        return self
+        pairs.append((edge_name, new_edge))
+        return pairs
 
     @override_animate(add_edge)
     def _add_edge_animation(
@@ -727,6 +851,8 @@ class MGraph(VDict, Labelable):
         edge_name = (node1_name, node2_name)
         edge_name_rev = (node2_name, node1_name)
 
+        # Live circle geometry: the cached centers may be stale if the
+        # graph moved, and the circle radius excludes the label's extent
         node1 = self.nodes[node1_name].circle
         node2 = self.nodes[node2_name].circle
 
@@ -741,15 +867,15 @@ class MGraph(VDict, Labelable):
             ),
             node1.get_center(),
             node2.get_center(),
-            node1.get_radius(),
-            node2.get_radius(),
+            node1.radius,
+            node2.radius,
             not reverse_exists,
             node_angle,
             arc_angle,
         )
         if weight:
             new_edge.weighted(
-                Text(str(weight), **self.style.edge_weight),
+                _make_text(str(weight), self._edge_weight_kwargs).copy(),
                 label_distance,
             )
 
@@ -758,8 +884,8 @@ class MGraph(VDict, Labelable):
                 new_edge.line,
                 node1.get_center(),
                 node2.get_center(),
-                node1.get_radius(),
-                node2.get_radius(),
+                node1.radius,
+                node2.radius,
                 False,
             )
             if weight:
@@ -827,10 +953,7 @@ class MGraph(VDict, Labelable):
             node_angle,
         )
         new_edge_1.weighted(
-            Text(
-                str(forward_weight),
-                **self.style.edge_weight,
-            ),
+            _make_text(str(forward_weight), self._edge_weight_kwargs).copy(),
             label_distance,
         )
 
@@ -844,16 +967,18 @@ class MGraph(VDict, Labelable):
             node_angle,
         )
         new_edge_2.weighted(
-            Text(
-                str(backward_weight),
-                **self.style.edge_weight,
-            ),
+            _make_text(str(backward_weight), self._edge_weight_kwargs).copy(),
             label_distance,
         )
 
-        self.edges[edge_name] = self[edge_name] = new_edge_1
+        # One removal and one bulk add keep the VDict bookkeeping to a
+        # single pass instead of three separate mutations; the forward
+        # edge may never have been registered under this key
+        if edge_name in self.submob_dict:
+            self.remove(edge_name)
+        self.edges[edge_name] = new_edge_1
         self.edges[edge_name_rev] = new_edge_2
-        self.add([(edge_name_rev, new_edge_2)])
+        self.add([(edge_name, new_edge_1), (edge_name_rev, new_edge_2)])
         return self
 
     @override_animate(show_backward_edge)
@@ -907,70 +1032,211 @@ class MGraph(VDict, Labelable):
             'shell_layout', and others supported by the underlying graph library.
             A full list of available layouts can be found in the NetworkX documentation:
             https://networkx.org/documentation/stable/reference/drawing.html#module-networkx.drawing.layout
+            The extra value 'fast_kamada_kawai_layout' selects a SciPy-backed
+            approximation of the Kamada-Kawai layout that is much faster on
+            graphs with hundreds of nodes.
 
         Returns
         -------
         self
             The updated instance of the :class:'MGraph' with nodes arranged according to the specified layout.
-        """
-        G = nx.DiGraph()
-        G.add_edges_from(self.edges.keys())
 
-        try:
-            layout_function = eval(f"nx.{layout}")
-            pos = layout_function(G)
-
-        except AttributeError:
-            print("Layout not available")
-            pos = nx.kamada_kawai_layout(G)
-
-        labels = list(pos.keys())
-
-        x = [x for x, y in pos.values()]
-        y = [y for x, y in pos.values()]
-
-        coeff_x = config.frame_x_radius / (abs(max(x) - min(x)))
-        coeff_y = config.frame_y_radius / (abs(max(y) - min(y)))
-
-        positions = []
+        Notes
+        -----
+        When every node was explicitly placed through ``nodes_position`` at
+        construction, the default layout is skipped so those coordinates are
+        kept; requesting any other layout still rearranges the nodes.
+        """
+        if (
+            layout == "kamada_kawai_layout"
+            and self._user_positions is not None
+            and all(name in self._user_positions for name in self.nodes)
+        ):
+            return self
 
-        for label in labels:
-            positions.append(
-                [
-                    pos.get(label)[0] * coeff_x,
-                    pos.get(label)[1] * coeff_y,
-                    0,
-                ]
-            )
+        cache_key = (layout, frozenset(self.nodes), frozenset(self.edges))
+        pos = _LAYOUT_CACHE.get(cache_key)
+        if pos is None:
+            if all((v, u) in self.edges for u, v in self.edges):
+                # Fully symmetric adjacency: an undirected graph halves the
+                # layout-time memory and the shortest-path work per edge
+                # Sorted so insertion order does not depend on randomized
+                # string hashing; the layout solvers are order-sensitive
+                G = nx.Graph(
+                    sorted({(u, v) if u <= v else (v, u) for u, v in self.edges})
+                )
+            else:
+                G = nx.DiGraph(list(self.edges.keys()))
 
-        nodes_and_positions = dict(zip(labels, positions, strict=False))
-        for node in nodes_and_positions:
-            self.nodes[node].move_to(nodes_and_positions[node])
-        for edge in self.edges:
-            node1 = self.nodes[edge[0]].circle
-            node2 = self.nodes[edge[1]].circle
-            start, end = self.edges[edge]._get_line_start_end(
-                node1.get_center(),
-                node2.get_center(),
-                node1.get_radius(),
-                node2.get_radius(),
+            if layout == "fast_kamada_kawai_layout":
+                pos = self._fast_kamada_kawai(G)
+            else:
+                # A dict hit for the supported layouts, a plain attribute
+                # lookup for the rest; eval would recompile the string on
+                # every call besides executing arbitrary input
+                layout_function = self._LAYOUTS.get(layout) or getattr(
+                    nx, layout, None
+                )
+                if layout_function is None:
+                    print("Layout not available")
+                    layout_function = nx.kamada_kawai_layout
+                if (
+                    layout_function is nx.kamada_kawai_layout
+                    and G.number_of_nodes() > 500
+                ):
+                    # Kamada-Kawai is prohibitive on big graphs when started
+                    # cold; a cheap spring embedding as the initial guess
+                    # cuts the solver iterations drastically
+                    pos = layout_function(
+                        G, pos=nx.spring_layout(G, iterations=50, seed=0)
+                    )
+                else:
+                    pos = layout_function(G)
+            if len(_LAYOUT_CACHE) >= _LAYOUT_CACHE_MAX:
+                # Evict the oldest entry so repeated previews of many
+                # different graphs cannot grow the cache without bound
+                del _LAYOUT_CACHE[next(iter(_LAYOUT_CACHE))]
+            _LAYOUT_CACHE[cache_key] = pos
+
+        # One broadcast rescale over all coordinates instead of per-node
+        # Python arithmetic
+        coords = np.array(list(pos.values()), dtype=float)[:, :2]
+        span = np.abs(coords.max(axis=0) - coords.min(axis=0))
+        coeff = np.array([config.frame_x_radius, config.frame_y_radius]) / span
+        positions = np.hstack([coords * coeff, np.zeros((len(coords), 1))])
+
+        # pos is insertion-ordered, so its keys line up with the rescaled
+        # rows; a single pass moves each node and refreshes its geometry
+        for node, position in zip(pos.keys(), positions, strict=True):
+            self.nodes[node].move_to(position)
+            self._node_geom[node] = (position, self._node_geom[node][1])
+        # Straight edges share one closed form, so their endpoints are
+        # computed in a single NumPy pass; curved edges keep the scalar
+        # method since each arc depends on its own angles
+        straight_edges: list[MGraph.StraightEdge] = []
+        straight_geom: list[tuple[Point3D, Point3D, float, float]] = []
+        updates: list[tuple[MGraph.Edge, Point3D, Point3D]] = []
+        for (name1, name2), mEdge in self.edges.items():
+            center1, radius1 = self._node_geom[name1]
+            center2, radius2 = self._node_geom[name2]
+            if isinstance(mEdge, MGraph.StraightEdge):
+                straight_edges.append(mEdge)
+                straight_geom.append((center1, center2, radius1, radius2))
+            else:
+                updates.append(
+                    (
+                        mEdge,
+                        *mEdge._get_line_start_end(
+                            center1, center2, radius1, radius2
+                        ),
+                    )
+                )
+        if straight_edges:
+            starts, ends = self.StraightEdge._batch_start_end(
+                np.array([g[0] for g in straight_geom]),
+                np.array([g[1] for g in straight_geom]),
+                np.array([g[2] for g in straight_geom]),
+                np.array([g[3] for g in straight_geom]),
             )
-            mEdge = self.edges[edge]
-            # Workaround cause tipped lines can't be changed of start/end, we have to delete the tip for a moment
-            if mEdge.line.has_tip():
-                tip = mEdge.line.get_tip()
-                mEdge.line.remove(tip)
-                mEdge.line.put_start_and_end_on(start, end)
-                mEdge.line.add_tip()
+            updates.extend(zip(straight_edges, starts, ends, strict=True))
+
+        # Label work runs as a second sweep over the edges that actually
+        # moved, keeping the geometry loop free of the weighted branch
+        moved_weighted: list[MGraph.Edge] = []
+        for mEdge, start, end in updates:
+            line = mEdge.line
+            last = mEdge._last_endpoints
+            # Comparing against the line's live start as well guards
+            # against the whole graph having been shifted since the
+            # endpoints were recorded
+            if (
+                last is not None
+                and np.array_equal(last[0], start)
+                and np.array_equal(last[1], end)
+                and np.array_equal(line.get_start(), start)
+            ):
+                continue
+            mEdge._last_endpoints = (start, end)
+            # Tipped lines can't be retargeted in place, so detach the tip,
+            # move the line and reattach the same tip object: add_tip(tip)
+            # repositions it without rebuilding the arrowhead geometry
+            if line.has_tip():
+                tip = line.get_tip()
+                line.remove(tip)
+                line.put_start_and_end_on(start, end)
+                line.add_tip(tip)
             else:
-                mEdge.line.put_start_and_end_on(start, end)
-            mEdge.highlighting.put_start_and_end_on(start, end)
+                line.put_start_and_end_on(start, end)
+            if mEdge._highlighting is not None:
+                # A highlight built later copies the repositioned line, so
+                # only existing ones need to follow the edge
+                mEdge._highlighting.put_start_and_end_on(start, end)
             if mEdge.is_weighted():
-                label_position = mEdge._get_label_position(mEdge.label_distance)
-                mEdge.label.move_to(label_position)
+                moved_weighted.append(mEdge)
+
+        for mEdge in moved_weighted:
+            mEdge.label.move_to(mEdge._get_label_position(mEdge.label_distance))
 
         return self
 
+    @staticmethod
+    def _fast_kamada_kawai(G: nx.DiGraph) -> dict[str, np.ndarray]:
+        """Approximates the Kamada-Kawai layout with SciPy primitives.
+
+        The graph-theoretic distances come from the C shortest-path solver in
+        scipy.sparse.csgraph and the positions minimize the Kamada-Kawai
+        stress through L-BFGS-B with a vectorized energy and gradient,
+        replacing the pure-Python O(n^2) NetworkX solver
+        that dominates layout time on large graphs.
+        """
+        # SciPy ships with Manim but is only needed for this layout
+        from scipy.optimize import minimize
+        from scipy.sparse import csr_matrix
+        from scipy.sparse.csgraph import shortest_path
+
+        names = list(G.nodes)
+        n = len(names)
+        if n == 0:
+            return {}
+        index = {name: i for i, name in enumerate(names)}
+
+        rows = [index[u] for u, v in G.edges]
+        cols = [index[v] for u, v in G.edges]
+        adjacency = csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(n, n)
+        )
+        dist = shortest_path(adjacency, method="D", directed=False)
+        # Pull disconnected components to a finite distance so the descent
+        # below keeps them on screen
+        finite = np.isfinite(dist)
+        dist[~finite] = dist[finite].max() * 2 if finite.any() else 1.0
+
+        # Kamada-Kawai weights: distant pairs matter quadratically less
+        weight = 1.0 / (dist * dist + np.eye(n))
+        np.fill_diagonal(weight, 0.0)
+
+        def stress(x: np.ndarray) -> tuple[float, np.ndarray]:
+            p = x.reshape(n, 2)
+            delta = p[:, None] - p[None, :]
+            norm = np.linalg.norm(delta, axis=-1)
+            np.fill_diagonal(norm, 1.0)
+            diff = weight * (norm - dist)
+            energy = 0.5 * float((diff * (norm - dist)).sum())
+            grad = 2.0 * ((diff / norm)[..., None] * delta).sum(axis=1)
+            return energy, grad.ravel()
+
+        rng = np.random.default_rng(0)
+        result = minimize(
+            stress,
+            (rng.random(n * 2) * 2 - 1),
+            method="L-BFGS-B",
+            jac=True,
+            options={"maxiter": 50},
+        )
+        pos = result.x.reshape(n, 2)
+
+        return {name: pos[i] for i, name in enumerate(names)}
+
     def set_nodes_highlight(
         self,
         color: ManimColor = RED,
@@ -992,8 +1258,11 @@ class MGraph(VDict, Labelable):
         self
             The updated instance of the MGraph with all nodes highlighted.
         """
-        for node in self.nodes:
-            self.nodes[node].set_highlight(color, width)
+        # One family-wide stroke pass over all highlights instead of a
+        # Python-level set_highlight call per node
+        VGroup(*(node.highlighting for node in self.nodes.values())).set_stroke(
+            color, width
+        )
         return self
 
     def set_edges_highlight(
@@ -1017,8 +1286,17 @@ class MGraph(VDict, Labelable):
         self
             The updated instance of the :class:'MGraph' with all edges highlighted.
         """
-        for edge in self.edges:
-            self.edges[edge].set_highlight(color, width)
+        # Bulk-stroke every highlight at once; only tipped edges need the
+        # per-edge pass afterwards to restore their arrowhead styling
+        VGroup(*(edge.highlighting for edge in self.edges.values())).set_stroke(
+            color, width
+        )
+        for edge in self.edges.values():
+            if edge.line.has_tip():
+                arrow_width: float = edge.line.get_tip().get_width()
+                edge.highlighting.get_tip().set_stroke(width=arrow_width).set_color(
+                    color
+                ).set_opacity(1)
         return self
 
     def add_label(
@@ -4,7 +4,7 @@ from manim import *
 from manim.typing import Vector3D
 
 from manim_dsa.constants import *
-from manim_dsa.m_collection.m_collection import MElement
+from manim_dsa.m_collection.m_collection import MElement, _make_text, _style_key
 from manim_dsa.utils.utils import *
 
 
@@ -16,7 +16,8 @@ class MVariable(MElement, Labelable):
     ):
         self.style = style
         super().__init__(
-            Rectangle(**self.style.square), Text(str(value), **self.style.value)
+            Rectangle(**self.style.square),
+            _make_text(str(value), _style_key(self.style.value)).copy(),
         )
 
     def add_label(
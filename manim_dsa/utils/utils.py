@@ -17,9 +17,12 @@ def set_text(old_manim_text: Text, new_text: str):
 
 
 def TextReplace(scene, scene_mobj1, mObj1: Text, mObj2: Text):
-    old_mobj = mObj1.copy()
+    # The incoming glyphs are reused for the fade-out instead of being
+    # copied; the new text still needs a visible stand-in because the
+    # in-scene target stays hidden until the flying copy has arrived
+    old_mobj = mObj1
     scene_mobj1 -= mObj1
-    mObj1 = set_text(mObj1, str(mObj2.text))
+    mObj1 = set_text(old_mobj, str(mObj2.text))
     scene_mobj1 += mObj1
     new_mobj = mObj1.copy()
     mObj1.set_opacity(0)
@@ -32,9 +35,9 @@ def TextReplace(scene, scene_mobj1, mObj1: Text, mObj2: Text):
 
 
 class Labelable:
-    def __init__(self):
-        super().__init__()
-        self.label = None
+    # Class-level default instead of an __init__: the mixin adds no frame
+    # to the MRO walk of every node and edge construction
+    label: Text | None = None
 
     def add_label(
         self, text: Text, direction: Vector3D = UP, buff: float = 0.5, **kwargs
@@ -48,17 +51,26 @@ class Labelable:
 
 
 class Highlightable:
-    def __init__(self):
-        super().__init__()
-        self.__target = None
-        self.highlighting = None
+    # Class-level defaults, see Labelable; instances only pay for these
+    # attributes once a highlight target is actually registered
+    __target: VMobject | None = None
+    _highlighting: VMobject | None = None
 
     def _add_highlight(self, target: VMobject):
         self.__target = target
-        self.highlighting = (
-            target.copy().set_fill(opacity=0).set_z_index(self.__target.z_index + 1)
-        )
-        self.set_highlight()
+
+    @property
+    def highlighting(self) -> VMobject:
+        # The highlight is a full copy of the target, so it is only built on
+        # first use; most mobjects in a scene are never highlighted
+        if self._highlighting is None and self.__target is not None:
+            self._highlighting = (
+                self.__target.copy()
+                .set_fill(opacity=0)
+                .set_z_index(self.__target.z_index + 1)
+            )
+            self.set_highlight()
+        return self._highlighting
 
     def highlight(self, stroke_color: ManimColor = RED, stroke_width: float = 8):
         self.set_highlight(stroke_color, stroke_width)